@@ -7,10 +7,14 @@ and success vs. failure counts for a specific launch site. Additionally, it feat
 a scatter chart displaying the correlation between payload mass and launch success.
 
 Dependencies:
+- numpy
 - pandas
-- dash
-- plotly.express
+- dash (2.9 or newer)
+- plotly
 - requests
+- flask-caching
+- orjson
+- pyarrow (parquet cache)
 - io
 - colorcet
 
@@ -18,24 +22,32 @@ Data Source:
 - SpaceX launch data is fetched from the following URL:
   https://cf-courses-data.s3.us.cloud-object-storage.appdomain.cloud/
   IBM-DS0321EN-SkillsNetwork/datasets/spacex_launch_dash.csv
+- The parsed data is cached in ~/.cache/spacex/launch.parquet and only
+  downloaded again when the remote file changes.
 
 Usage:
 - Run this module to start the Dash web application and navigate to the provided URL.
+- For production, serve it with gunicorn: gunicorn -c gunicorn_config.py dash_app:server
 
 Authors:
 - Yan Luo https://www.linkedin.com/in/yan-luo-96288783/
 - Andrey Pomortsev https://www.linkedin.com/in/andreypomortsev/
 """
 import io
+import json
+from pathlib import Path
+
 import requests
 
+import numpy as np
 import pandas as pd
-import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
 
 import dash
-from dash import html
-from dash.dependencies import Input, Output
-import dash_core_components as dcc
+from dash import dcc, html
+from dash.dependencies import Input, Output, State
+from flask_caching import Cache
 
 import colorcet as cc
 
@@ -45,29 +57,391 @@ DATA_URL = (
     "IBM-DS0321EN-SkillsNetwork/datasets/spacex_launch_dash.csv"
 )
 
-try:
-    response = requests.get(DATA_URL, timeout=2)
-    response.raise_for_status()  # Raises an HTTPError for bad responses (4xx or 5xx)
-except requests.exceptions.RequestException as e:
-    raise f"Error fetching or processing data from {DATA_URL}: {e}"
+# On-disk cache of the parsed dataset, revalidated against the server with a
+# conditional GET so warm starts skip both the download and the CSV parse
+CACHE_DIR = Path.home() / ".cache" / "spacex"
+CACHE_FILE = CACHE_DIR / "launch.parquet"
+CACHE_META = CACHE_DIR / "meta.json"
+
+# Only the columns the dashboard uses, with compact dtypes: repeated strings as
+# categories so filters compare integer codes, and narrow numeric types
+USECOLS = ["Launch Site", "class", "Payload Mass (kg)", "Booster Version Category"]
+DTYPES = {
+    "Launch Site": "category",
+    "Booster Version Category": "category",
+    "class": "int8",
+    "Payload Mass (kg)": "float32",
+}
+
+
+def read_cache():
+    """
+    Reads the cached launch data, cast to the current dtypes so a cache written
+    with older dtypes is still loaded in the expected schema.
+
+    Returns:
+    - pandas.DataFrame or None: The cached data, or None if it is missing or unreadable.
+    """
+    if not CACHE_FILE.exists():
+        return None
+    try:
+        return pd.read_parquet(CACHE_FILE, columns=USECOLS).astype(DTYPES)
+    except (OSError, ValueError):
+        return None
+
+
+def read_cache_meta():
+    """
+    Reads the HTTP validators stored alongside the cached launch data.
+
+    Returns:
+    - dict: The stored "etag" and "last_modified", empty if missing or unreadable.
+    """
+    if not (CACHE_FILE.exists() and CACHE_META.exists()):
+        return {}
+    try:
+        meta = json.loads(CACHE_META.read_text())
+    except (OSError, ValueError):
+        return {}
+    return meta if isinstance(meta, dict) else {}
+
+
+def write_cache(df, response):
+    """
+    Writes the launch data and the response validators to the on-disk cache.
+    A cache that cannot be written (e.g. a read-only home) is skipped.
+
+    Parameters:
+    - df (pandas.DataFrame): The parsed launch data.
+    - response (requests.Response): The response the data was parsed from.
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(CACHE_FILE, compression="zstd")
+        CACHE_META.write_text(
+            json.dumps(
+                {
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                }
+            )
+        )
+    except OSError:
+        pass
 
-# Read the airline data into pandas dataframe
-spacex_df = pd.read_csv(io.BytesIO(response.content))
+
+def load_spacex_data():
+    """
+    Loads the SpaceX launch data, reusing the on-disk parquet cache when the
+    remote CSV has not changed since it was cached or cannot be fetched.
+
+    Returns:
+    - pandas.DataFrame: The SpaceX launch data.
+
+    Raises:
+    - RuntimeError: If the data cannot be fetched and there is no cached copy.
+    """
+    # Revalidate the cached copy with its ETag / Last-Modified validators
+    meta = read_cache_meta()
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        response = requests.get(DATA_URL, headers=headers, timeout=2)
+        response.raise_for_status()  # Raises an HTTPError for bad responses (4xx or 5xx)
+
+        # 304 Not Modified: the cached copy is still current
+        if response.status_code == 304:
+            df = read_cache()
+            if df is not None:
+                return df
+            # The cached copy is unreadable, download the data unconditionally
+            response = requests.get(DATA_URL, timeout=2)
+            response.raise_for_status()
+    except requests.exceptions.RequestException as e:
+        # Fall back to the cached copy so the app can still start offline
+        df = read_cache()
+        if df is not None:
+            return df
+        raise RuntimeError(f"Error fetching data from {DATA_URL}: {e}") from e
+
+    # Read the launch data into pandas dataframe and refresh the cache
+    df = pd.read_csv(io.BytesIO(response.content), usecols=USECOLS, dtype=DTYPES)
+    write_cache(df, response)
+    return df
+
+
+spacex_df = load_spacex_data()
 max_payload = spacex_df["Payload Mass (kg)"].max()
 min_payload = spacex_df["Payload Mass (kg)"].min()
 
+# Scatter marker sizes binned into 8 payload buckets instead of raw payloads
+spacex_df["_size_bin"] = (
+    pd.cut(spacex_df["Payload Mass (kg)"], bins=8, labels=False).astype("int8") * 3 + 4
+)
+
+# Precompute the pie-chart aggregates once so callbacks only pick a tiny summary
+# Successful launches per site, used for the "ALL" pie chart
+all_success = (
+    spacex_df.loc[spacex_df["class"] == 1, "Launch Site"]
+    .value_counts(sort=False)
+    .rename_axis("Launch Site")
+    .reset_index(name="count")
+)
+# Success vs. failure counts per site, used for the site-specific pie chart,
+# split into one small frame per site so the callback does a dict lookup
+per_site = {
+    site: counts
+    for site, counts in spacex_df.groupby(["Launch Site", "class"], observed=True)
+    .size()
+    .reset_index(name="count")
+    .groupby("Launch Site", observed=True)
+}
+
+# Presort launches by payload for every site (and "ALL") so the scatter callback
+# can slice the payload range with a binary search instead of boolean masks
+site_groups = {
+    "ALL": spacex_df.sort_values("Payload Mass (kg)").reset_index(drop=True)
+}
+site_groups.update(
+    {
+        site: sub.sort_values("Payload Mass (kg)").reset_index(drop=True)
+        for site, sub in spacex_df.groupby("Launch Site", observed=True)
+    }
+)
+# Column arrays of the presorted frames; the scatter callback slices views of
+# them and never builds a filtered DataFrame
+site_columns = {
+    site: {
+        "payload": sub["Payload Mass (kg)"].to_numpy(),
+        "class": sub["class"].to_numpy(),
+        "booster": sub["Booster Version Category"].cat.codes.to_numpy(),
+        "size": sub["_size_bin"].to_numpy(),
+    }
+    for site, sub in site_groups.items()
+}
+booster_categories = spacex_df["Booster Version Category"].cat.categories
+
+# Marker area scale, the same as plotly express uses with size_max=20
+SIZE_REF = spacex_df["_size_bin"].max() / 20**2
+
+# Scatter chart layout and hover text, shared with the clientside callback
+SCATTER_HOVERTEMPLATE = "Payload=%{x}<br>Outcome=%{y}"
+SCATTER_LAYOUT = {
+    "xaxis": {"title": {"text": "Payload Mass"}},
+    # Name the y-axis ticks and rotate their labels
+    "yaxis": {
+        "title": {"text": "Launch Outcome"},
+        "tickvals": [0, 1],
+        "ticktext": ["Failure", "Success"],
+        "tickangle": -90,
+    },
+    "legend": {"title": {"text": "Booster Version Category"}},
+}
+
+# Payload slider marks every 500 kg
+SLIDER_MARKS = {i: str(i) for i in range(0, 10500, 500)}
+
 # Define a custom colorblind-friendly palette for pie-chart
 COLORS = ["#377eb8", "#ff7f00", "#f781bf", "#4daf4a"]
 
 # Define a presumably colorblind-friendly palette for scatter plots
 PALETTE = cc.glasbey_light
 
+# Fixed color for every launch site and booster version category
+SITE_COLOR_MAP = dict(zip(spacex_df["Launch Site"].cat.categories, COLORS))
+BOOSTER_COLOR_MAP = dict(
+    zip(spacex_df["Booster Version Category"].cat.categories, PALETTE)
+)
+
+
+# TASK 2:
+# Pie chart for the `site-dropdown` value, shown in `success-pie-chart`
+def get_pie_chart(entered_site):
+    """
+    Generates a pie chart showing the total successful launches count for all sites or
+    the Success vs. Failed counts for a specific launch site based on user input.
+
+    Parameters:
+    - entered_site (str): The selected launch site.
+
+    Returns:
+    - plotly.graph_objs.Figure: The generated pie chart.
+    """
+    if entered_site == "ALL":
+        # Draw the precomputed successful launch counts per site
+        fig = go.Figure(
+            go.Pie(
+                labels=all_success["Launch Site"],
+                values=all_success["count"],
+                marker_colors=[
+                    SITE_COLOR_MAP[site] for site in all_success["Launch Site"]
+                ],
+            )
+        )
+        fig.update_layout(title="Percentage of Successful Launches Across All Sites")
+
+        return fig
+
+    # Draw the precomputed success vs. failure counts for the selected site
+    counts = per_site[entered_site]
+    fig = go.Figure(
+        go.Pie(
+            labels=counts["class"].map({0: "Failure", 1: "Success"}),
+            values=counts["count"],
+            marker_colors=counts["class"].map({1: COLORS[3], 0: COLORS[1]}),
+        )
+    )
+    fig.update_layout(title=f"Success vs. Failure for Launch Site: {entered_site}")
+    # Add custom legend
+    fig.update_layout(
+        legend=dict(title=dict(text="Outcome"))
+    )
+
+    return fig
+
+
+# TASK 4:
+# Scatter chart for the `site-dropdown` and `payload-slider` values,
+# shown in `success-payload-scatter-chart`
+def get_scatter_chart(entered_site, selected_payload_range):
+    """
+    Generates a scatter chart showing the correlation between payload and launch success
+    for all sites or a specific launch site based on user input.
+
+    Parameters:
+    - entered_site (str): The selected launch site.
+    - selected_payload_range (list): The selected payload range.
+
+    Returns:
+    - plotly.graph_objs.Figure: The generated scatter chart.
+    """
+    # Pick the presorted column arrays for the selected site ("ALL" included)
+    columns = site_columns[entered_site]
+    payloads = columns["payload"]
+
+    # Title
+    title = (
+        f"Site: {entered_site}, "
+        f"Payload mass is between "
+        f"{int(selected_payload_range[0]):8,d} kg and "
+        f"{int(selected_payload_range[1]):8,d} kg"
+    )
+
+    # Slice views of the presorted columns to the selected payload range
+    lo_i = np.searchsorted(payloads, selected_payload_range[0], side="left")
+    hi_i = np.searchsorted(payloads, selected_payload_range[1], side="right")
+    payloads = payloads[lo_i:hi_i]
+    outcomes = columns["class"][lo_i:hi_i]
+    boosters = columns["booster"][lo_i:hi_i]
+    sizes = columns["size"][lo_i:hi_i]
+
+    # Create a scatter chart with one WebGL trace per booster version category,
+    # skipping launches without one (category code -1)
+    traces = []
+    for code in np.unique(boosters[boosters >= 0]):
+        booster = booster_categories[code]
+        points = boosters == code
+        traces.append(
+            go.Scattergl(
+                x=payloads[points],
+                y=outcomes[points],
+                mode="markers",
+                name=booster,
+                marker=dict(
+                    color=BOOSTER_COLOR_MAP[booster],
+                    size=sizes[points],
+                    sizemode="area",
+                    sizeref=SIZE_REF,
+                ),
+                # Compact hover text instead of per-column hover data
+                hovertemplate=SCATTER_HOVERTEMPLATE,
+            )
+        )
+    fig = go.Figure(traces)
+    fig.update_layout(SCATTER_LAYOUT, title=title)
+    return fig
+
+
+sites = ["ALL", *spacex_df["Launch Site"].cat.categories]
+
+
+def stored_figure(fig):
+    """
+    Converts a figure for the clientside store, without its layout template.
+    The template is the same for every figure, so it is stored once and
+    applied in the browser.
+
+    Parameters:
+    - fig (plotly.graph_objs.Figure): The figure to store.
+
+    Returns:
+    - dict: The figure data and layout.
+    """
+    fig.layout.template = None
+    return fig.to_plotly_json()
+
+
+def stored_columns(columns):
+    """
+    Converts the presorted column arrays of a site for the clientside store,
+    dropping the launches without a payload mass (sorted last).
+
+    Parameters:
+    - columns (dict): The "payload", "class", "booster" and "size" arrays.
+
+    Returns:
+    - dict: The same columns as plain lists.
+    """
+    count = np.count_nonzero(~np.isnan(columns["payload"]))
+    return {
+        "payload": np.round(columns["payload"][:count].astype("float64"), 2).tolist(),
+        "class": columns["class"][:count].tolist(),
+        "booster": columns["booster"][:count].tolist(),
+        "size": columns["size"][:count].tolist(),
+    }
+
+
+# Everything the browser needs to draw the charts without a server round trip:
+# the five pie figures, and the presorted scatter columns of every site, which
+# the clientside callback slices to the payload range with a binary search
+fig_cache = {
+    "template": pio.templates[pio.templates.default].to_plotly_json(),
+    "pie": {site: stored_figure(get_pie_chart(site)) for site in sites},
+    "scatter": {
+        "layout": SCATTER_LAYOUT,
+        "hovertemplate": SCATTER_HOVERTEMPLATE,
+        "size_ref": float(SIZE_REF),
+        "boosters": [
+            {"name": booster, "color": BOOSTER_COLOR_MAP[booster]}
+            for booster in booster_categories
+        ],
+        "sites": {site: stored_columns(site_columns[site]) for site in sites},
+    },
+}
+
+
+# Serialize the layout, including the precomputed chart data, with orjson
+pio.json.config.default_engine = "orjson"
+
 # Create a dash application
 app = dash.Dash(__name__)
+# Expose the Flask server for WSGI servers, e.g. gunicorn dash_app:server
+server = app.server
+
+# Memoize the server-side fallback for figures missing from the store
+cache = Cache(
+    app.server,
+    config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 3600},
+)
 
 # Extract options from the DataFrame
 options = [
-    {"label": value, "value": value} for value in spacex_df["Launch Site"].unique()
+    {"label": value, "value": value}
+    for value in spacex_df["Launch Site"].cat.categories
 ]
 options.insert(0, {"label": "All Sites", "value": "ALL"})
 
@@ -97,126 +471,183 @@ app.layout = html.Div(
             min=0,
             max=10000,
             step=1000,
-            marks={i: str(i) for i in range(0, 10500, 500)},
+            marks=SLIDER_MARKS,
             value=[min_payload, max_payload],
         ),
         # TASK 4: Add a scatter chart to show the correlation between payload and launch success
         html.Div(dcc.Graph(id="success-payload-scatter-chart")),
+        # Precomputed chart data served by the clientside callbacks
+        dcc.Store(id="fig-cache", data=fig_cache),
+        # Scatter inputs the store has no data for, built on the server
+        dcc.Store(id="scatter-miss"),
     ]
 )
 
 
-# TASK 2:
-# Add a callback function for `site-dropdown` as input, `success-pie-chart` as output
-# Function decorator to specify function input and output
-@app.callback(
+# Show the precomputed pie chart for the selected site
+app.clientside_callback(
+    """
+    function(entered_site, figures) {
+        // A cleared dropdown shows an empty chart
+        if (entered_site === null || entered_site === undefined) {
+            return {data: [], layout: {template: figures.template}};
+        }
+        const fig = figures.pie[entered_site];
+        if (fig === undefined) {
+            return window.dash_clientside.no_update;
+        }
+        return {...fig, layout: {...fig.layout, template: figures.template}};
+    }
+    """,
     Output(component_id="success-pie-chart", component_property="figure"),
     Input(component_id="site-dropdown", component_property="value"),
+    State(component_id="fig-cache", component_property="data"),
 )
-def get_pie_chart(entered_site):
-    """
-    Generates a pie chart showing the total successful launches count for all sites or
-    the Success vs. Failed counts for a specific launch site based on user input.
 
-    Parameters:
-    - entered_site (str): The selected launch site.
-
-    Returns:
-    - plotly.graph_objs.Figure: The generated pie chart.
+# Draw the scatter chart for the selected site and payload range in the browser
+app.clientside_callback(
     """
-    filtered_df = spacex_df
-    if entered_site == "ALL":
-        # Filter the DataFrame to include only successes (where 'class' is 1)
-        filtered_df = spacex_df[spacex_df["class"] == 1]
-        fig = px.pie(
-            data_frame=filtered_df,
-            names="Launch Site",
-            title="Percentage of Successful Launches Across All Sites",
-            color="Launch Site",
-            color_discrete_map=dict(zip(filtered_df["Launch Site"].unique(), COLORS)),
-        )
-
-        return fig
-
-    # Filter the DataFrame based on the selected site and create a pie chart
-    filtered_df = filtered_df[filtered_df["Launch Site"] == entered_site]
-    fig = px.pie(
-        data_frame=filtered_df,
-        names=filtered_df['class'].map({0: 'Failure', 1: 'Success'}),
-        title=f"Success vs. Failure for Launch Site: {entered_site}",
-        color="class",
-        color_discrete_map={1: COLORS[3], 0: COLORS[1]},
-    )
-    # Add custom legend
-    fig.update_layout(
-        legend=dict(title=dict(text="Outcome"))
-    )
-
-    return fig
-
-
-# TASK 4:
-# Add a callback function for `site-dropdown` and `payload-slider` as inputs,
-# `success-payload-scatter-chart` as output
-@app.callback(
+    function(entered_site, payload_range, figures) {
+        // A cleared dropdown shows an empty chart
+        if (entered_site === null || entered_site === undefined) {
+            return [
+                {data: [], layout: {template: figures.template}},
+                window.dash_clientside.no_update,
+            ];
+        }
+        const scatter = figures.scatter;
+        const columns = scatter.sites[entered_site];
+        if (columns === undefined) {
+            // Let the server build the figure for these inputs
+            return [
+                window.dash_clientside.no_update,
+                {site: entered_site, payload_range: payload_range},
+            ];
+        }
+
+        // First index with a payload >= value, or > value when `after` is set
+        const payloads = columns.payload;
+        const bound = (value, after) => {
+            let low = 0;
+            let high = payloads.length;
+            while (low < high) {
+                const mid = (low + high) >> 1;
+                if (payloads[mid] < value || (after && payloads[mid] === value)) {
+                    low = mid + 1;
+                } else {
+                    high = mid;
+                }
+            }
+            return low;
+        };
+        const start = bound(payload_range[0], false);
+        const end = bound(payload_range[1], true);
+
+        // One WebGL trace per booster version category, skipping launches
+        // without one (category code -1)
+        const traces = new Map();
+        for (let i = start; i < end; i++) {
+            const code = columns.booster[i];
+            if (code < 0) {
+                continue;
+            }
+            if (!traces.has(code)) {
+                const booster = scatter.boosters[code];
+                traces.set(code, {
+                    type: "scattergl",
+                    mode: "markers",
+                    name: booster.name,
+                    x: [],
+                    y: [],
+                    marker: {
+                        color: booster.color,
+                        size: [],
+                        sizemode: "area",
+                        sizeref: scatter.size_ref,
+                    },
+                    hovertemplate: scatter.hovertemplate,
+                });
+            }
+            const trace = traces.get(code);
+            trace.x.push(payloads[i]);
+            trace.y.push(columns.class[i]);
+            trace.marker.size.push(columns.size[i]);
+        }
+        const data = [...traces.keys()].sort((a, b) => a - b).map(
+            (code) => traces.get(code)
+        );
+
+        const kg = (value) => Math.trunc(value).toLocaleString("en-US").padStart(8);
+        const title = (
+            `Site: ${entered_site}, Payload mass is between ` +
+            `${kg(payload_range[0])} kg and ${kg(payload_range[1])} kg`
+        );
+        return [
+            {
+                data: data,
+                layout: {
+                    ...scatter.layout,
+                    title: {text: title},
+                    template: figures.template,
+                },
+            },
+            window.dash_clientside.no_update,
+        ];
+    }
+    """,
     Output(component_id="success-payload-scatter-chart", component_property="figure"),
+    Output(component_id="scatter-miss", component_property="data"),
     Input(component_id="site-dropdown", component_property="value"),
     Input(component_id="payload-slider", component_property="value"),
+    State(component_id="fig-cache", component_property="data"),
 )
-def get_scatter_chart(entered_site, selected_payload_range):
+
+
+# Build the scatter chart on the server when the site is missing from the store
+@app.callback(
+    Output(
+        component_id="success-payload-scatter-chart",
+        component_property="figure",
+        allow_duplicate=True,
+    ),
+    Input(component_id="scatter-miss", component_property="data"),
+    prevent_initial_call=True,
+)
+def get_missing_scatter_chart(missed):
     """
-    Generates a scatter chart showing the correlation between payload and launch success
-    for all sites or a specific launch site based on user input.
+    Generates the scatter chart for a site the clientside store has no data for.
 
     Parameters:
-    - entered_site (str): The selected launch site.
-    - selected_payload_range (list): The selected payload range.
+    - missed (dict): The selected "site" and "payload_range".
 
     Returns:
     - plotly.graph_objs.Figure: The generated scatter chart.
     """
-    # Check if the selected site is "ALL"
-    if entered_site == "ALL":
-        # No site-specific filtering
-        filtered_df = spacex_df
-    else:
-        # Filter the DataFrame based on the selected site
-        filtered_df = spacex_df[spacex_df["Launch Site"] == entered_site]
+    # Slider values arrive as a list, pass them on as a hashable cache key
+    return build_scatter_chart(missed["site"], tuple(missed["payload_range"]))
 
-    # Title
-    title = (
-        f"Site: {entered_site}, "
-        f"Payload mass is between "
-        f"{int(selected_payload_range[0]):8,d} kg and "
-        f"{int(selected_payload_range[1]):8,d} kg"
-    )
 
-    # Filter the DataFrame based on the selected payload range
-    filtered_df = filtered_df[
-        (filtered_df["Payload Mass (kg)"] >= selected_payload_range[0])
-        & (filtered_df["Payload Mass (kg)"] <= selected_payload_range[1])
-    ]
+@cache.memoize()
+def build_scatter_chart(entered_site, selected_payload_range):
+    """
+    Builds the scatter chart, memoized on its inputs.
 
-    # Create a scatter chart
-    fig = px.scatter(
-        filtered_df,
-        x="Payload Mass (kg)",
-        y="class",
-        color="Booster Version Category",
-        title=title,
-        labels={"class": "Launch Outcome", "Payload Mass (kg)": "Payload Mass"},
-        category_orders={"class": [0, 1]},
-        color_discrete_map=dict(
-            zip(filtered_df["Booster Version Category"].unique(), PALETTE)
-        ),
-        size="Payload Mass (kg)",  # Add this line to set the size
-    )
+    Parameters:
+    - entered_site (str): The selected launch site.
+    - selected_payload_range (tuple): The selected payload range.
 
-    # Update y-axis ticks and rotate labels
-    fig.update_yaxes(tickvals=[0, 1], ticktext=["Failure", "Success"], tickangle=-90)
-    return fig
+    Returns:
+    - plotly.graph_objs.Figure: The generated scatter chart.
+    """
+    return get_scatter_chart(entered_site, selected_payload_range)
 
 
 # Run the app
 if __name__ == "__main__":
-    app.run_server()
+    # Run without the dev tools: no hot reload, props checks or debug UI
+    app.run(
+        debug=False,
+        dev_tools_hot_reload=False,
+        dev_tools_props_check=False,
+        dev_tools_ui=False,
+    )
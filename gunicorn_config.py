@@ -0,0 +1,21 @@
+"""
+Gunicorn configuration for the SpaceX Launch Dashboard.
+
+Usage:
+- gunicorn -c gunicorn_config.py dash_app:server
+- Listens on 127.0.0.1:8050 by default; override it with --bind, e.g.
+  gunicorn -c gunicorn_config.py --bind 0.0.0.0:8050 dash_app:server
+"""
+import os
+
+bind = "127.0.0.1:8050"
+
+# Worker processes, each with a few threads to serve requests concurrently
+workers = (2 * (os.cpu_count() or 1)) + 1
+worker_class = "gthread"
+threads = 4
+
+# Load the app before forking so the data is fetched and the figures are
+# precomputed once in the master instead of once per worker; the workers
+# inherit the memory at fork, though refcount updates gradually copy the pages
+preload_app = True